@@ -8,10 +8,78 @@ bl_info = {
 import bpy
 import logging
 import json
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+import numpy as np
+
+try:
+    # orjson is several times faster than the stdlib encoder but isn't bundled with Blender
+    import orjson
+except ImportError:
+    orjson = None
 
 
 log = logging.getLogger(__name__)
 
+_json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+# Keyframe attributes we serialize, split by how they're laid out for foreach_get/foreach_set
+VECTOR_FIELDS = ('co', 'handle_left', 'handle_right')
+SCALAR_FIELDS = ('amplitude', 'back', 'period')
+ENUM_FIELDS = ('easing', 'handle_left_type', 'handle_right_type', 'interpolation', 'type')
+KEYFRAME_FIELDS = VECTOR_FIELDS + SCALAR_FIELDS + ENUM_FIELDS
+
+# Lazily built by enum_tables()
+_enum_tables = None
+
+
+def enum_identifiers(field):
+    """Map the raw values of a keyframe enum property to their string identifiers"""
+    enum_items = bpy.types.Keyframe.bl_rna.properties[field].enum_items
+    return {item.value: item.identifier for item in enum_items}
+
+
+def enum_tables():
+    """
+    Grab the cached keyframe enum tables, built from bl_rna on first use
+    
+    Returns ({field: {value: identifier}}, {field: {identifier: value}}) for mapping raw values to identifiers on export
+    and back to the raw values foreach_set takes on import
+    """
+    global _enum_tables
+    if _enum_tables is None:
+        identifiers = {field: enum_identifiers(field) for field in ENUM_FIELDS}
+        values = {field: {identifier: value for value, identifier in table.items()}
+                  for field, table in identifiers.items()}
+        _enum_tables = identifiers, values
+    return _enum_tables
+
+
+def keyframe_defaults():
+    """Grab the RNA default of every serialized keyframe field, these get left out of the json"""
+    properties = bpy.types.Keyframe.bl_rna.properties
+    return {field: list(properties[field].default_array) if field in VECTOR_FIELDS else properties[field].default
+            for field in KEYFRAME_FIELDS}
+
+
+def json_dumps(obj):
+    """Serialize to json bytes, using orjson when it's available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encoder.encode(obj).encode('utf-8')
+
+
+def json_load(filepath):
+    """Parse a json file, using orjson when it's available"""
+    if orjson is not None:
+        with open(filepath, 'rb', buffering=1 << 20) as file:
+            return orjson.loads(file.read())
+    # The stdlib parser works on str, so read as text rather than holding a bytes copy alongside the decoded one
+    with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as file:
+        return json.load(file)
+
 
 # ---- EXPORT
 
@@ -27,6 +95,18 @@ class ANIMIO_OT_fcurve_exporter(bpy.types.Operator):
     # Ensure we are only writing out json
     filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
     filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    binary: bpy.props.BoolProperty(
+        name="Binary Keyframes",
+        description="Write keyframe values to a .npz file next to the JSON, which only keeps the curve info",
+        default=False
+    )
+    precision: bpy.props.IntProperty(
+        name="Precision",
+        description="Decimal places to round keyframe values to, this is lossy. 0 keeps full precision",
+        default=0,
+        min=0,
+        max=7
+    )
     
     # -- Logging helpers
     
@@ -36,35 +116,154 @@ class ANIMIO_OT_fcurve_exporter(bpy.types.Operator):
         self.report({'ERROR'}, msg)
         
     # -- JSON converters
+    
+    def curve_to_json(self, channel, group, enum_maps, defaults):
+        """Build the json dict for an fcurve, storing its identity once alongside its keyframes"""
+        columns = self.read_keyframe_columns(channel.keyframe_points, enum_maps)
         
-    def keyframe_to_json(self, keyframe, data_path, array_index, group):
-        if type(keyframe) != bpy.types.Keyframe:
-            print(keyframe)
-            raise TypeError('Fcurve exporter is treating a non-keyframe object as a keyframe. Contact dev.')
+        # Leave out fields that are at their default for every keyframe of the curve. co is always kept since it's what
+        # carries the keyframe count, without it a curve of all default keyframes would export as empty
+        fields = []
+        kept_columns = []
+        for field, column in zip(KEYFRAME_FIELDS, columns):
+            default = defaults[field]
+            if field == 'co' or any(value != default for value in column):
+                fields.append(field)
+                kept_columns.append(column)
         
         return {
-            'data_path': data_path,
+            'data_path': channel.data_path,
             'group': group,
-            'array_index': array_index,
-            'amplitude': keyframe.amplitude,
-            'back': keyframe.back,
-            'co': list(keyframe.co),
-            'easing': keyframe.easing,
-            'handle_left': list(keyframe.handle_left),
-            'handle_left_type': keyframe.handle_left_type,
-            'handle_right': list(keyframe.handle_right),
-            'handle_right_type': keyframe.handle_right_type,
-            'interpolation': keyframe.interpolation,
-            'period': keyframe.period,
-            'type': keyframe.type
+            'array_index': channel.array_index,
+            # Assemble the keyframe dicts from the columns with iterators alone, no python call per keyframe
+            'keyframes': list(map(dict, map(zip, repeat(fields), zip(*kept_columns))))
         }
         
+    @staticmethod
+    def read_keyframe_buffers(keyframe_points):
+        """Read each keyframe attribute of an fcurve with a single foreach_get call rather than per keyframe"""
+        count = len(keyframe_points)
+        buffers = {}
+        for field in VECTOR_FIELDS:
+            buffers[field] = np.empty(count * 2, dtype=np.float32)
+        for field in SCALAR_FIELDS:
+            buffers[field] = np.empty(count, dtype=np.float32)
+        for field in ENUM_FIELDS:
+            # Enums come back as their raw values
+            buffers[field] = np.empty(count, dtype=np.int32)
+        for field, buffer in buffers.items():
+            keyframe_points.foreach_get(field, buffer)
+        return buffers
+        
+    def rounded(self, values):
+        """Round float values to the export precision, passing them through untouched at full precision"""
+        if not self.precision:
+            return values
+        # Round in double precision so the json gets the short decimal rather than the nearest float32
+        return np.round(np.asarray(values, dtype=np.float64), self.precision)
+        
+    def read_keyframe_columns(self, keyframe_points, enum_maps):
+        """Read the keyframe attributes of an fcurve as json-ready columns, ordered as KEYFRAME_FIELDS"""
+        buffers = self.read_keyframe_buffers(keyframe_points)
+        columns = []
+        for field in VECTOR_FIELDS:
+            columns.append(self.rounded(buffers[field]).reshape(-1, 2).tolist())
+        for field in SCALAR_FIELDS:
+            columns.append(self.rounded(buffers[field]).tolist())
+        for field in ENUM_FIELDS:
+            # Swap the raw enum values for the identifiers so the json stays readable
+            identifiers = enum_maps[field]
+            columns.append([identifiers[value] for value in buffers[field].tolist()])
+        return columns
+        
     # -- Entry point
     
     @classmethod
     def poll(cls, context):
         return context.object is not None
     
+    def iter_channels(self, action):
+        """Yield every grouped fcurve in the action along with its group name, with sampled curves temporarily keyed"""
+        
+        # Grab groups and iterate over to write fcurve data
+        for group in action.groups:
+            group_name = group.name
+            # For each fcurve write out the keyframes
+            for channel in group.channels:
+                # Each channel is an fcurve, make sure it's calculated as keyframes
+                sampled = False
+                if not channel.keyframe_points:
+                    # Treat as sampled and convert, reusing the frame range when converting back
+                    sampled = True
+                    frame_range = channel.range()
+                    first_frame, last_frame = int(frame_range[0]), int(frame_range[1])
+                    channel.convert_to_keyframes(first_frame, last_frame)
+                yield channel, group_name
+                
+                if sampled:
+                    channel.convert_to_samples(first_frame, last_frame)
+    
+    def write_json(self, action):
+        """Write the curves and their keyframes out as a single json file"""
+        enum_maps, _ = enum_tables()
+        defaults = keyframe_defaults()
+        if self.precision:
+            # Round the defaults the same way as the keyframes so they still match up
+            defaults.update({field: self.rounded(defaults[field]).tolist() for field in VECTOR_FIELDS + SCALAR_FIELDS})
+        
+        # Stream each curve to disk as it's encoded rather than holding the full action and its serialized string
+        with open(self.filepath, 'wb', buffering=1 << 20) as file:
+            file.write(b'{"name":%s,"curves":[' % json_dumps(action.name))
+            first = True
+            for channel, group_name in self.iter_channels(action):
+                if not first:
+                    file.write(b',')
+                first = False
+                file.write(json_dumps(self.curve_to_json(channel, group_name, enum_maps, defaults)))
+            file.write(b']}')
+            
+    def write_binary(self, action):
+        """Write the curve info as json and the keyframe values of every curve to a .npz sidecar next to it"""
+        sidecar_path = os.path.splitext(self.filepath)[0] + '.npz'
+        
+        curves = []
+        buffers = {field: [] for field in KEYFRAME_FIELDS}
+        for channel, group_name in self.iter_channels(action):
+            for field, buffer in self.read_keyframe_buffers(channel.keyframe_points).items():
+                buffers[field].append(buffer)
+            curves.append({
+                'data_path': channel.data_path,
+                'group': group_name,
+                'array_index': channel.array_index,
+                'count': len(channel.keyframe_points)
+            })
+        
+        # Every curve's keyframes are laid end to end in one array per field, the json counts tell them apart
+        fields = {
+            field: np.concatenate(parts) if parts else np.empty(0, dtype=np.int32 if field in ENUM_FIELDS else np.float32)
+            for field, parts in buffers.items()
+        }
+        if not self.precision:
+            np.savez(sidecar_path, **fields)
+        else:
+            # Lossy mode, store float fields as float16 when that stays within the requested precision
+            tolerance = 0.5 * 10 ** -self.precision
+            for field in VECTOR_FIELDS + SCALAR_FIELDS:
+                half = fields[field].astype(np.float16)
+                if np.all(np.abs(half.astype(np.float32) - fields[field]) <= tolerance):
+                    fields[field] = half
+            np.savez_compressed(sidecar_path, **fields)
+        
+        action_data = {
+            'name': action.name,
+            'sidecar': os.path.basename(sidecar_path),
+            # Enums are stored as raw values, keep the identifiers they stand for in case they differ on import
+            'enums': enum_tables()[1],
+            'curves': curves
+        }
+        with open(self.filepath, 'wb', buffering=1 << 20) as file:
+            file.write(json_dumps(action_data))
+    
     def execute(self, context):
         """Serialize the keyframe data as json and write to disk"""
         
@@ -80,39 +279,13 @@ class ANIMIO_OT_fcurve_exporter(bpy.types.Operator):
         
         # Good to go, grab active action
         action = anim_data.action
-            
-        action_data = {
-                        'name': action.name,
-                        'keyframes': []
-                       }
-        
-        # Grab groups and iterate over to write fcurve data
-        groups = action.groups
-        for group_name, group in groups.items():
-            # For each fcurve write out the keyframes
-            for _, channel in group.channels.items():
-                # Each channel is an fcurve, make sure it's calculated as keyframes
-                sampled = False
-                if not channel.keyframe_points:
-                    # Treat as sampled and convert
-                    sampled = True
-                    channel.convert_to_keyframes(*[int(f) for f in channel.range()])
-                data_path = channel.data_path
-                array_index = channel.array_index
-                # We store the channel and group info in each keyframe because it pairs well with blender's keyframe_insert
-                keyframes = [self.keyframe_to_json(kf, data_path, array_index, group_name) for kf in channel.keyframe_points]
-                # Add these keyframes to our list to serialize
-                action_data['keyframes'].extend(keyframes)
-                
-                if sampled:
-                    channel.convert_to_samples(*[int(f) for f in channel.range()])
         
-        print("Writing curve data to %s" % self.filepath)
+        log.info("Writing curve data to %s", self.filepath)
         
-        with open(self.filepath, 'w+') as file:
-            # Write the json to file via the output path prop
-            serialized_action = json.dumps(action_data)
-            file.write(serialized_action)
+        if self.binary:
+            self.write_binary(action)
+        else:
+            self.write_json(action)
             
         return {'FINISHED'}
     
@@ -135,22 +308,67 @@ class FCurveImporterMixin:
         self.report({'ERROR'}, msg)
         
     @staticmethod
-    def touch_fcurve(action, data_path, array_index, replace=False):
-        """Create or grab the fcurve for the data_path of a given action"""
-        for curve in action.fcurves:
-            if curve.data_path != data_path:
-                continue
-            if curve.array_index == array_index:
-                if not replace:
-                    # Return the found curve
-                    return curve
-                # Otherwise free up the curve slot
-                action.fcurves.remove(curve)
-                break
+    def touch_fcurve(action, fcurves, data_path, array_index, replace=False):
+        """
+        Create or grab the fcurve for the data_path of a given action
+        
+        fcurves is a {(data_path, array_index): fcurve} lookup of the action's curves, kept up to date as curves are created
+        """
+        curve = fcurves.get((data_path, array_index))
+        if curve is not None:
+            if not replace:
+                # Return the found curve
+                return curve
+            # Otherwise free up the curve slot
+            action.fcurves.remove(curve)
+            
+        curve = fcurves[(data_path, array_index)] = action.fcurves.new(data_path, index=array_index)
+        return curve
+        
+    def sidecar_curves(self, anim_data_json):
+        """Attach the keyframe arrays of each curve from the binary sidecar written alongside the json"""
+        sidecar_path = os.path.join(os.path.dirname(self.filepath), anim_data_json['sidecar'])
+        with np.load(sidecar_path) as sidecar:
+            # Lossy exports may store floats as float16, foreach_set wants them back as float32
+            fields = {field: sidecar[field] if field in ENUM_FIELDS else sidecar[field].astype(np.float32, copy=False)
+                      for field in KEYFRAME_FIELDS}
+            
+        # Enums were stored as the exporting Blender's raw values, remap them onto this one's
+        _, enum_values = enum_tables()
+        for field in ENUM_FIELDS:
+            exported = anim_data_json['enums'][field]
+            lookup = np.zeros(max(exported.values()) + 1, dtype=np.int32)
+            for identifier, value in exported.items():
+                lookup[value] = enum_values[field][identifier]
+            fields[field] = lookup[fields[field]]
             
-        return action.fcurves.new(data_path, index=array_index)
+        # Curves are laid end to end in each array, slice them back apart using their keyframe counts
+        curves = anim_data_json['curves']
+        offset = 0
+        for curve in curves:
+            count = curve['count']
+            curve['arrays'] = {
+                field: array[offset * 2:(offset + count) * 2] if field in VECTOR_FIELDS else array[offset:offset + count]
+                for field, array in fields.items()
+            }
+            offset += count
+        return curves
+        
+    def json_curves(self, anim_data_json):
+        """Grab the list of curves from imported json, regrouping files written with the older flat keyframe list"""
+        if 'sidecar' in anim_data_json:
+            return self.sidecar_curves(anim_data_json)
+        if 'curves' in anim_data_json:
+            return anim_data_json['curves']
         
-    def insert_keyframes(self, action, keyframe_data, filter=None, replace_curve=True):
+        # Older exports repeated the curve info on every keyframe, group those back into curves
+        curves = defaultdict(list)
+        for keyframe in anim_data_json['keyframes']:
+            curves[(keyframe['data_path'], keyframe['array_index'])].append(keyframe)
+        return [{'data_path': data_path, 'array_index': array_index, 'keyframes': keyframes}
+                for (data_path, array_index), keyframes in curves.items()]
+        
+    def insert_keyframes(self, action, curve_data, filter=None, replace_curve=True):
         """
         Insert keyframes from dict data into action
         
@@ -158,8 +376,9 @@ class FCurveImporterMixin:
         ------
         obj
             The object containing the curve
-        keyframe_data
-            The JSON-like list of keyframes
+        curve_data
+            The JSON-like list of curves, each holding its data_path, array_index and either its keyframes or, when read from
+            a binary sidecar, its packed keyframe arrays
         filter
             an optional set of fcurves to target, i.e. filter = {(data_path, array_index)} will target that path and index and omit
             all other curves
@@ -167,38 +386,86 @@ class FCurveImporterMixin:
             an toggle for whether to replace a curve with the keyframe data being passed in or merge the imported keyframes into it
         """
         
-        replaced = set()
-        for keyframe in keyframe_data:
-            data_path = keyframe['data_path']
-            array_index = keyframe['array_index']
-            
-            if filter and (data_path, array_index) not in filter:
-                # Ignore this curve
-                continue
-            
-            # Grab/create the relevant fcurve based on path and index data
-            fcurve = self.touch_fcurve(action, data_path, array_index, 
-                                        replace_curve if (data_path, array_index) not in replaced else False)
-            if replace_curve:
-                # Log that this curve is one we added so we don't replace in the future
-                replaced.add((data_path, array_index))
-            
-            # We want to insert directly like this rather than use keyframe_insert since this returns the new keyframe itself
-            new_keyframe = fcurve.keyframe_points.insert(
-                *keyframe['co'],
-                keyframe_type=keyframe['type']
-            )
+        # Swap enum identifiers for their raw values so they can go through foreach_set
+        _, enum_values = enum_tables()
+        # Default values are left out of exported keyframes
+        defaults = keyframe_defaults()
+        
+        # Look curves up by path and index instead of scanning the action for every curve we touch
+        fcurves = {(curve.data_path, curve.array_index): curve for curve in action.fcurves}
+        
+        # Ignore any curves outside the filter up front so we only pack the ones being imported
+        if filter:
+            curve_data = [curve for curve in curve_data if (curve['data_path'], curve['array_index']) in filter]
+        
+        def pack(curve):
+            if 'arrays' in curve:
+                # Already loaded from a binary sidecar
+                return curve['arrays']
+            return self.keyframe_arrays(curve['keyframes'], enum_values, defaults)
+        
+        touched = set()
+        # Packing keyframes into arrays doesn't touch RNA so it runs on a thread pool, ahead of the RNA writes which
+        # Blender needs to stay on this thread
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for curve, arrays in zip(curve_data, executor.map(pack, curve_data)):
+                key = (curve['data_path'], curve['array_index'])
+                
+                # Grab/create the relevant fcurve based on path and index data. Exported curves are unique so each is
+                # normally touched once, but never replace a curve we already filled in case the data lists it twice
+                fcurve = self.touch_fcurve(action, fcurves, *key, replace_curve and key not in touched)
+                
+                self.add_keyframes(fcurve, arrays)
+                touched.add(key)
+        
+        # Sort the added keyframes into place and recalculate handles once per curve, after everything has been written
+        for key in touched:
+            fcurves[key].update()
             
-            # Add other properties
-            new_keyframe.amplitude = float(keyframe['amplitude'])
-            new_keyframe.back = float(keyframe['back'])
-            new_keyframe.easing = keyframe['easing']
-            new_keyframe.handle_left = [float(v) for v in keyframe['handle_left']]
-            new_keyframe.handle_left_type = keyframe['handle_left_type']
-            new_keyframe.handle_right = [float(v) for v in keyframe['handle_right']]
-            new_keyframe.handle_right_type = keyframe['handle_right_type']
-            new_keyframe.interpolation = keyframe['interpolation']
-            new_keyframe.period = keyframe['period']
+    @staticmethod
+    def keyframe_arrays(keyframes, enum_values, defaults):
+        """Pack json keyframes into one flat typed array per field, ready for foreach_set"""
+        count = len(keyframes)
+        arrays = {}
+        # Stream the json values straight into typed arrays rather than building intermediate lists per field
+        for field in VECTOR_FIELDS:
+            default = defaults[field]
+            arrays[field] = np.fromiter(chain.from_iterable(kf.get(field, default) for kf in keyframes),
+                                        dtype=np.float32, count=count * 2)
+        for field in SCALAR_FIELDS:
+            default = defaults[field]
+            arrays[field] = np.fromiter((kf.get(field, default) for kf in keyframes), dtype=np.float32, count=count)
+        for field in ENUM_FIELDS:
+            values = enum_values[field]
+            default = defaults[field]
+            arrays[field] = np.fromiter((values[kf.get(field, default)] for kf in keyframes), dtype=np.int32, count=count)
+        return arrays
+        
+    @staticmethod
+    def add_keyframes(fcurve, arrays):
+        """Append keyframes to an fcurve with one foreach_set per attribute rather than inserting them one at a time"""
+        keyframe_points = fcurve.keyframe_points
+        count = len(arrays['co']) // 2
+        
+        if keyframe_points:
+            # Merging into an existing curve, drop any keyframes sitting on an imported frame like keyframe_points.insert would
+            existing_co = np.empty(len(keyframe_points) * 2, dtype=np.float32)
+            keyframe_points.foreach_get('co', existing_co)
+            for index in reversed(np.flatnonzero(np.isin(existing_co[::2], arrays['co'][::2])).tolist()):
+                keyframe_points.remove(keyframe_points[index], fast=True)
+        
+        start = len(keyframe_points)
+        keyframe_points.add(count)
+        total = len(keyframe_points)
+        
+        for field, values in arrays.items():
+            width = 2 if field in VECTOR_FIELDS else 1
+            buffer = np.empty(total * width, dtype=values.dtype)
+            if start:
+                # foreach_set covers the whole collection so carry over the keyframes that were already there
+                keyframe_points.foreach_get(field, buffer)
+            buffer[start * width:] = values
+            keyframe_points.foreach_set(field, buffer)
             
     # --- Standard operator logic
     
@@ -221,24 +488,19 @@ class ANIMIO_OT_action_importer(bpy.types.Operator, FCurveImporterMixin):
     # -- Entry point
     
     def execute(self, context):
-        with open(self.filepath, 'r') as file:
-            # As long as we successfully open the file
-            text = file.read()
-            anim_data_json = json.loads(text)
-            
-            print(anim_data_json)
-            
-            # Grab the selected object
-            obj = context.object
-            # Clear any animation data that might exist (in case this is being used to replace existing action)
-            obj.animation_data_clear()
-            anim_data = obj.animation_data_create()
-            # Create the action to assign
-            action = context.blend_data.actions.new(anim_data_json['name'])
-            anim_data.action = action
-            
-            # Insert all keyframes into new action
-            self.insert_keyframes(action, anim_data_json['keyframes'])
+        anim_data_json = json_load(self.filepath)
+        
+        # Grab the selected object
+        obj = context.object
+        # Clear any animation data that might exist (in case this is being used to replace existing action)
+        obj.animation_data_clear()
+        anim_data = obj.animation_data_create()
+        # Create the action to assign
+        action = context.blend_data.actions.new(anim_data_json['name'])
+        anim_data.action = action
+        
+        # Insert all keyframes into new action
+        self.insert_keyframes(action, self.json_curves(anim_data_json))
             
         return {'FINISHED'}
 
@@ -248,22 +510,19 @@ class FCurveResolverMixin(FCurveImporterMixin):
     
     def execute(self, context):
         """Open file path and import keyframes. Replace fcurves according to the replace class property"""
-        with open(self.filepath, 'r') as file:
-            # As long as we successfully open the file
-            text = file.read()
-            anim_data_json = json.loads(text)
-            
-            # Grab the selected object
-            obj = context.object
-            # This operator assumes an action already exists, raise exception if called in other context
-            if not obj.animation_data or not obj.animation_data.action:
-                # This will only be necessary if called from console after registered since we filter it out in our menu_func
-                raise ValueError('Operator %s should only be called on objects with animation data and action')
-            
-            action = obj.animation_data.action
-            
-            # Insert keyframes with the replace toggle on
-            self.insert_keyframes(action, anim_data_json['keyframes'], replace_curve=self.replace_curve)
+        anim_data_json = json_load(self.filepath)
+        
+        # Grab the selected object
+        obj = context.object
+        # This operator assumes an action already exists, raise exception if called in other context
+        if not obj.animation_data or not obj.animation_data.action:
+            # This will only be necessary if called from console after registered since we filter it out in our menu_func
+            raise ValueError('Operator %s should only be called on objects with animation data and action')
+        
+        action = obj.animation_data.action
+        
+        # Insert keyframes with the replace toggle on
+        self.insert_keyframes(action, self.json_curves(anim_data_json), replace_curve=self.replace_curve)
             
         return {'FINISHED'}
     
@@ -310,15 +569,16 @@ def graph_context_menu_func(self, context):
         
     layout.separator()
         
+register_operators, unregister_operators = bpy.utils.register_classes_factory(operators)
+
 def register():
-    for cls in operators:
-        bpy.utils.register_class(cls)
+    register_operators()
     # Add the ops to the graph context menu
     bpy.types.GRAPH_MT_context_menu.prepend(graph_context_menu_func)
     
 def unregister():
-    for cls in operators:
-        bpy.utils.unregister_class(cls)
+    bpy.types.GRAPH_MT_context_menu.remove(graph_context_menu_func)
+    unregister_operators()
         
 if __name__ == "__main__":
     register()
\ No newline at end of file